@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for speedup.py.
+
+Run from the repository root with:
+    python3 -m unittest discover benchmarks/scripts
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import speedup
+
+
+def _entry(qubits=14, gates=256, parallel='false', score=10.0, error=0.1):
+    return {
+        'benchmark': 'com.omaarr90.benchmarks.StateVectorParallelBenchmark.runCircuit',
+        'params': {'qubits': str(qubits), 'gates': str(gates), 'parallel': parallel},
+        'primaryMetric': {'score': score, 'scoreError': error, 'rawData': [[score]]},
+    }
+
+
+def _backends():
+    """Patch sets selecting each installed whole-document JSON parser."""
+    backends = {'json': {'simdjson': None, 'orjson': None}}
+    if speedup.orjson is not None:
+        backends['orjson'] = {'simdjson': None, 'orjson': speedup.orjson}
+    if speedup.simdjson is not None:
+        backends['simdjson'] = {'simdjson': speedup.simdjson}
+    return backends
+
+
+class IterBenchmarksTest(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def write(self, document):
+        with open(self.path, 'w') as f:
+            json.dump(document, f)
+
+    def test_missing_field_is_named_on_every_backend(self):
+        cases = {
+            'params.qubits': {'params': {}, 'primaryMetric': {'score': 1.0, 'scoreError': 0.1}},
+            'params': {'primaryMetric': {'score': 1.0, 'scoreError': 0.1}},
+            'primaryMetric.scoreError': dict(_entry(), primaryMetric={'score': 1.0}),
+        }
+        for backend, patches in _backends().items():
+            for field, entry in cases.items():
+                with self.subTest(backend=backend, field=field), \
+                        mock.patch.multiple(speedup, **patches):
+                    self.write([entry])
+                    with self.assertRaises(KeyError) as cm:
+                        list(speedup.iter_benchmarks(self.path))
+                    self.assertEqual(cm.exception.args, (field,))
+
+    def test_parses_entries(self):
+        self.write([_entry(), _entry(parallel='true', score=2.5)])
+        results = list(speedup.iter_benchmarks(self.path))
+        self.assertEqual(results, [
+            speedup.BenchmarkResult(14, 256, False, 10.0, 0.1),
+            speedup.BenchmarkResult(14, 256, True, 2.5, 0.1),
+        ])
+
+    @unittest.skipIf(speedup.ijson is None, "ijson is not installed")
+    def test_streaming_rejects_non_array_documents(self):
+        with mock.patch.object(speedup, 'STREAMING_THRESHOLD_BYTES', 0):
+            self.write([_entry()])
+            self.assertEqual(len(list(speedup.iter_benchmarks(self.path))), 1)
+            
+            for document in ({'a': 1}, 5):
+                with self.subTest(document=document):
+                    self.write(document)
+                    with self.assertRaises(ValueError):
+                        list(speedup.iter_benchmarks(self.path))
+
+
+
+class GeometricMeanTest(unittest.TestCase):
+
+    def test_rejects_non_positive_values_on_both_paths(self):
+        for size in (3, speedup.NUMPY_MIN_VALUES):
+            for bad in (0.0, -1.0, float('nan')):
+                with self.subTest(size=size, bad=bad):
+                    with self.assertRaises(ValueError):
+                        speedup.geometric_mean([2.0] * (size - 1) + [bad])
+
+    def test_matches_definition_on_both_paths(self):
+        for size in (3, speedup.NUMPY_MIN_VALUES):
+            with self.subTest(size=size):
+                values = [1.0, 4.0] * size
+                self.assertAlmostEqual(speedup.geometric_mean(values), 2.0, places=12)
+
+
+class LoadSpeedupsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'results.json')
+        with open(self.path, 'w') as f:
+            # (20, 1024) has no parallel run
+            json.dump([_entry(), _entry(parallel='true', score=2.5),
+                       _entry(qubits=20, gates=1024)], f)
+
+    def test_cache_hit_reports_sidecar_and_keeps_missing_keys(self):
+        parsed, cache = speedup.load_speedups(self.path)
+        self.assertIsNone(cache)
+        
+        cached, cache = speedup.load_speedups(self.path)
+        self.assertEqual(cache, speedup.Path(self.tmp.name, 'results.speedups.json'))
+        self.assertEqual(cached, parsed)
+        self.assertEqual(cached[2], [(20, 1024)])
+
+    def test_no_cache_never_uses_sidecar(self):
+        speedup.load_speedups(self.path)
+        self.assertIsNone(speedup.load_speedups(self.path, use_cache=False)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()